@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Prebuild the PokeAPI sprite URL lookup for the configured team.
+
+Sprite URLs for a given Pokemon never change between runs, so resolving
+them ahead of time lets PokemonFetcher skip the /pokemon/{name} metadata
+request entirely and go straight to the sprite download.
+
+Run from the project root after editing the team in config.yaml:
+
+    python scripts/prebuild_pokemon_urls.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import requests
+import yaml
+
+API_URL = "https://pokeapi.co/api/v2/pokemon"
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONFIG_PATH = PROJECT_ROOT / "config.yaml"
+OUTPUT_PATH = PROJECT_ROOT / "src" / "assets" / "sprite_urls.json"
+
+
+def team_names(config: dict) -> list[str]:
+    """Extract normalized Pokemon names from the configured team."""
+    names = []
+    for pokemon in config.get("pokemon_team", []):
+        name = pokemon.get("name", "") if isinstance(pokemon, dict) else pokemon
+        name = (name or "").lower().strip()
+        if name:
+            names.append(name)
+    return names
+
+
+def main() -> int:
+    with open(CONFIG_PATH, "r") as f:
+        config = yaml.safe_load(f)
+
+    names = team_names(config)
+    if not names:
+        print("No pokemon_team entries found in config.yaml")
+        return 1
+
+    sprite_urls: dict[str, dict[str, str | None]] = {}
+    session = requests.Session()
+
+    for name in names:
+        response = session.get(f"{API_URL}/{name}", timeout=30)
+        if response.status_code != 200:
+            print(f"  Warning: could not resolve {name} (HTTP {response.status_code})")
+            continue
+
+        sprites = response.json().get("sprites", {})
+        sprite_urls[name] = {
+            "front_default": sprites.get("front_default"),
+            "front_shiny": sprites.get("front_shiny"),
+        }
+        print(f"  Resolved {name}")
+
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_PATH, "w") as f:
+        json.dump(sprite_urls, f, indent=2)
+
+    print(f"Wrote {len(sprite_urls)} entries to {OUTPUT_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,80 @@
 """GitHub API client for fetching user statistics."""
 
+import functools
 import os
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# GraphQL query documents, kept as module-level constants so they are built
+# (and interned) once per process instead of per call.
+_QUERY_REPO_OVERVIEW = """
+query($after: String) {
+    viewer {
+        repositories(first: 100, ownerAffiliations: OWNER, after: $after) {
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            nodes {
+                name
+                isFork
+                stargazerCount
+                languages(first: 20) {
+                    edges {
+                        size
+                        node {
+                            name
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+_QUERY_COMMITS = """
+query($username: String!, $from: DateTime!, $to: DateTime!) {
+    user(login: $username) {
+        contributionsCollection(from: $from, to: $to) {
+            totalCommitContributions
+            restrictedContributionsCount
+        }
+    }
+}
+"""
+
+_QUERY_CONTRIBS = """
+query($username: String!) {
+  user(login: $username) {
+    contributionsCollection {
+      totalCommitContributions
+      restrictedContributionsCount
+      contributionCalendar {
+        totalContributions
+      }
+    }
+    pullRequests {
+      totalCount
+    }
+    issues {
+      totalCount
+    }
+  }
+}
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_language_name(name: str) -> str:
+    """Normalize a language name for case-insensitive comparison (cached)."""
+    return (name or "").strip().casefold()
 
 
 class GitHubStats:
@@ -13,58 +83,155 @@ class GitHubStats:
     GRAPHQL_URL = "https://api.github.com/graphql"
     REST_API_URL = "https://api.github.com"
 
-    def __init__(self, username: str, token: str | None = None):
+    # Optimistic starting budget per token; corrected by response headers.
+    _RATE_LIMIT_BUDGET = 5000
+
+    def __init__(
+        self,
+        username: str,
+        token: str | None = None,
+        tokens: list[str] | None = None,
+    ):
         self.username = username
-        self.token = token or os.environ.get("GITHUB_ACCESS_TOKEN")
-        if not self.token:
+
+        # Accept a pool of tokens so heavy fan-outs can spread their
+        # rate-limit cost; fall back to the single-token environment setup.
+        if tokens is None:
+            env_tokens = os.environ.get("GITHUB_ACCESS_TOKENS", "")
+            tokens = [t.strip() for t in env_tokens.split(",") if t.strip()]
+        if not tokens:
+            single = token or os.environ.get("GITHUB_ACCESS_TOKEN")
+            tokens = [single] if single else []
+        if not tokens:
             raise ValueError(
                 "GitHub access token required. Set GITHUB_ACCESS_TOKEN environment variable."
             )
+
+        self._tokens = list(tokens)
+        # Remaining quota per token, refined from X-RateLimit-Remaining.
+        self._token_remaining: dict[str, int] = {
+            t: self._RATE_LIMIT_BUDGET for t in self._tokens
+        }
+
+        self.token = self._tokens[0]
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github.v3+json",
         }
+        # Shared session so repeated calls reuse pooled connections instead of
+        # paying a fresh TLS handshake per request. Retries cover transient
+        # rate-limit and gateway errors with exponential backoff.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        # Memoized repo aggregates so get_all_stats fetches the list only once.
+        self._repo_aggregates_cache: tuple[int, Counter[str]] | None = None
+        # Process-lifetime cache of parsed GraphQL responses, keyed by
+        # (query, variables), guarding against repeated identical calls.
+        self._graphql_cache: dict[tuple[str, tuple], dict[str, Any]] = {}
+        # Normalized once up front via set_excluded_languages; config is
+        # loaded a single time so there is no need to renormalize per call.
+        self._excluded_norm: frozenset[str] = frozenset()
+
+    def _next_headers(self) -> tuple[str, dict[str, str]]:
+        """Pick the token with the most remaining quota for the next request."""
+        token = max(self._tokens, key=self._token_remaining.__getitem__)
+        return token, {"Authorization": f"Bearer {token}"}
+
+    def _record_rate_limit(self, token: str, response: requests.Response) -> None:
+        """Update a token's remaining quota from the response headers."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining and remaining.isdigit():
+            self._token_remaining[token] = int(remaining)
+
+    def set_excluded_languages(self, excluded_languages: list[str] | None) -> None:
+        """Set the default excluded languages, normalized once."""
+        self._excluded_norm = frozenset(
+            _normalize_language_name(x) for x in (excluded_languages or []) if x
+        )
 
-    def _fetch_repos(self, include_private: bool = False) -> list[dict[str, Any]]:
+    def _graphql(
+        self, query: str, variables: dict[str, Any], cache: bool = True
+    ) -> dict[str, Any]:
         """
-        Fetch repositories for the user.
+        Run a GraphQL query and return the `data` payload.
 
-        If include_private is True, uses the authenticated `/user/repos` endpoint so
-        private owner repos are included (token must belong to the user and have repo scope).
+        Responses are cached per run unless `cache` is False — callers that
+        aggregate and discard large payloads should opt out so the raw pages
+        do not stay resident.
         """
-        repos: list[dict[str, Any]] = []
-        page = 1
-        per_page = 100
-
-        # `/user/repos` includes private repos for the authenticated user when type=owner.
-        base_url = (
-            f"{self.REST_API_URL}/user/repos"
-            if include_private
-            else f"{self.REST_API_URL}/users/{self.username}/repos"
+        cache_key = (query, tuple(sorted(variables.items())))
+        if cache:
+            cached = self._graphql_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        token, auth_headers = self._next_headers()
+        response = self.session.post(
+            self.GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers=auth_headers,
+            timeout=30,
         )
+        self._record_rate_limit(token, response)
+        response.raise_for_status()
+        # orjson decodes large GraphQL payloads several times faster than
+        # the stdlib json parser used by response.json().
+        data = orjson.loads(response.content)
 
-        while True:
-            params = {
-                "per_page": per_page,
-                "page": page,
-                "type": "owner",  # owner scope matches prior behavior
-            }
+        if "errors" in data:
+            raise RuntimeError(f"GraphQL error: {data['errors']}")
 
-            response = requests.get(base_url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            page_repos = response.json()
+        if cache:
+            self._graphql_cache[cache_key] = data["data"]
+        return data["data"]
 
-            if not page_repos:
-                break
+    def _fetch_repo_aggregates(self) -> tuple[int, Counter[str]]:
+        """
+        Fetch all owned repositories (including private ones) and fold them
+        into the star total and language-byte counter, 100 repos per page.
+
+        A single paginated GraphQL query replaces the old per-repo REST
+        fan-out, so the network cost is O(N/100) round trips instead of O(N).
+        Each page is aggregated and dropped immediately, so only the compact
+        aggregate state persists rather than every repo's raw JSON. The
+        result is memoized on the instance: both the star total and the
+        language breakdown read it, and refetching would double the cost.
+        """
+        if self._repo_aggregates_cache is not None:
+            return self._repo_aggregates_cache
 
-            repos.extend(page_repos)
+        total_stars = 0
+        language_bytes: Counter[str] = Counter()
+        after: str | None = None
 
-            if len(page_repos) < per_page:
-                break
+        while True:
+            data = self._graphql(_QUERY_REPO_OVERVIEW, {"after": after}, cache=False)
+            repositories = data["viewer"]["repositories"]
 
-            page += 1
+            page_stars, page_languages = self._aggregate_from_repos(
+                repositories["nodes"]
+            )
+            total_stars += page_stars
+            language_bytes.update(page_languages)
 
-        return repos
+            page_info = repositories["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
+            after = page_info["endCursor"]
+
+        self._repo_aggregates_cache = (total_stars, language_bytes)
+        return self._repo_aggregates_cache
 
     def get_commits_this_year(self) -> int:
         """Get the total number of commits over the last 365 days (rolling window)."""
@@ -72,88 +239,52 @@ class GitHubStats:
         from_date = (now - timedelta(days=365)).strftime("%Y-%m-%dT%H:%M:%SZ")
         to_date = now.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        query = """
-        query($username: String!, $from: DateTime!, $to: DateTime!) {
-            user(login: $username) {
-                contributionsCollection(from: $from, to: $to) {
-                    totalCommitContributions
-                    restrictedContributionsCount
-                }
-            }
-        }
-        """
-
         variables = {
             "username": self.username,
             "from": from_date,
             "to": to_date,
         }
 
-        response = requests.post(
-            self.GRAPHQL_URL,
-            json={"query": query, "variables": variables},
-            headers=self.headers,
-            timeout=30,
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = self._graphql(_QUERY_COMMITS, variables)
 
-        if "errors" in data:
-            raise RuntimeError(f"GraphQL error: {data['errors']}")
-
-        contributions = data["data"]["user"]["contributionsCollection"]
+        contributions = data["user"]["contributionsCollection"]
         total = contributions["totalCommitContributions"]
         restricted = contributions["restrictedContributionsCount"]
 
         return total + restricted
 
-    def get_total_stars(self) -> int:
-        """Get the total number of stars across all user repositories."""
+    @staticmethod
+    def _aggregate_from_repos(
+        repos: list[dict[str, Any]],
+    ) -> tuple[int, Counter[str]]:
+        """Aggregate the star total and language bytes in one pass over repos."""
         total_stars = 0
-        repos = self._fetch_repos(include_private=True)
+        language_bytes: Counter[str] = Counter()
 
         for repo in repos:
-            total_stars += repo.get("stargazers_count", 0)
+            total_stars += repo.get("stargazerCount", 0)
+
+            if repo.get("isFork"):
+                continue  # Skip forked repositories
+
+            edges = (repo.get("languages") or {}).get("edges") or []
+            language_bytes.update(
+                {edge["node"]["name"]: edge["size"] for edge in edges}
+            )
 
-        return total_stars
+        return total_stars, language_bytes
+
+    def get_total_stars(self) -> int:
+        """Get the total number of stars across all user repositories."""
+        return self._fetch_repo_aggregates()[0]
 
     def get_contribution_stats(self) -> dict[str, int]:
         """Get aggregated contribution stats for the user."""
-        query = """
-        query($username: String!) {
-          user(login: $username) {
-            contributionsCollection {
-              totalCommitContributions
-              restrictedContributionsCount
-              contributionCalendar {
-                totalContributions
-              }
-            }
-            pullRequests {
-              totalCount
-            }
-            issues {
-              totalCount
-            }
-          }
-        }
-        """
-
         variables = {"username": self.username}
 
-        response = requests.post(
-            self.GRAPHQL_URL,
-            json={"query": query, "variables": variables},
-            headers=self.headers,
-            timeout=30,
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        if "errors" in data:
-            raise RuntimeError(f"GraphQL error: {data['errors']}")
+        data = self._graphql(_QUERY_CONTRIBS, variables)
 
-        user = data["data"]["user"]
+        user = data["user"]
         contributions = user["contributionsCollection"]
 
         total_commits = (
@@ -170,65 +301,51 @@ class GitHubStats:
             ),
         }
 
-    def get_language_breakdown(self) -> dict[str, int]:
+    def get_language_breakdown(self) -> Counter[str]:
         """Get the breakdown of languages used across all repositories."""
-        language_bytes: dict[str, int] = {}
-        # First, get all repositories (including private owner repos)
-        repos = self._fetch_repos(include_private=True)
-
-        # Then, get language breakdown for each repository
-        for repo in repos:
-            if repo.get("fork"):
-                continue  # Skip forked repositories
-
-            repo_name = repo["name"]
-            url = f"{self.REST_API_URL}/repos/{self.username}/{repo_name}/languages"
-
-            response = requests.get(url, headers=self.headers, timeout=30)
-            if response.status_code == 200:
-                repo_languages = response.json()
-                for lang, bytes_count in repo_languages.items():
-                    language_bytes[lang] = language_bytes.get(lang, 0) + bytes_count
-
-        return language_bytes
-
-    @staticmethod
-    def _normalize_language_name(name: str) -> str:
-        """Normalize a language name for case-insensitive comparison."""
-        return (name or "").strip().casefold()
+        return self._fetch_repo_aggregates()[1]
 
     def get_language_percentages(
-        self, top_n: int = 5, excluded_languages: list[str] | None = None
+        self,
+        top_n: int = 5,
+        excluded_languages: list[str] | None = None,
+        language_bytes: Counter[str] | None = None,
     ) -> list[tuple[str, float]]:
-        """Get the top N languages as percentages, optionally excluding some."""
-        language_bytes = self.get_language_breakdown()
+        """
+        Get the top N languages as percentages, optionally excluding some.
+
+        Pass a precomputed `language_bytes` counter to avoid re-aggregating
+        the repo list when the caller already has one.
+        """
+        if language_bytes is None:
+            language_bytes = self.get_language_breakdown()
 
         if not language_bytes:
             return []
 
         # Remove excluded languages before selecting top N so we still return N items when possible.
-        if excluded_languages:
-            excluded = {
-                self._normalize_language_name(x) for x in excluded_languages if x
-            }
-            if excluded:
-                language_bytes = {
+        if excluded_languages is not None:
+            excluded = frozenset(
+                _normalize_language_name(x) for x in excluded_languages if x
+            )
+        else:
+            excluded = self._excluded_norm
+        if excluded:
+            language_bytes = Counter(
+                {
                     lang: bytes_count
                     for lang, bytes_count in language_bytes.items()
-                    if self._normalize_language_name(lang) not in excluded
+                    if _normalize_language_name(lang) not in excluded
                 }
+            )
 
         if not language_bytes:
             return []
 
         total_bytes = sum(language_bytes.values())
 
-        # Sort by bytes and get top N
-        sorted_languages = sorted(
-            language_bytes.items(), key=lambda x: x[1], reverse=True
-        )
-
-        top_languages = sorted_languages[:top_n]
+        # Heap-based partial sort: O(N log k) instead of sorting everything
+        top_languages = language_bytes.most_common(top_n)
 
         # Calculate percentages
         result = []
@@ -245,11 +362,14 @@ class GitHubStats:
         # Preserve existing key for backwards compatibility
         contribution_stats["commits_this_year"] = contribution_stats["total_commits"]
 
+        # One pass over the repo list yields both stars and language bytes.
+        total_stars, language_bytes = self._fetch_repo_aggregates()
+
         return {
             **contribution_stats,
-            "total_stars": self.get_total_stars(),
-            "languages": self.get_language_percentages(excluded_languages=excluded_languages),
+            "total_stars": total_stars,
+            "languages": self.get_language_percentages(
+                excluded_languages=excluded_languages,
+                language_bytes=language_bytes,
+            ),
         }
-
-
-
@@ -2,10 +2,11 @@
 """Main entry point for the GitHub Stats Card Generator."""
 
 import argparse
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
 import yaml
 from dotenv import load_dotenv
 from PIL import Image
@@ -87,6 +88,11 @@ def main() -> int:
     language_gradient = languages_config.get("gradient", True)
     language_bar_border = languages_config.get("border", False)
     
+    output_config = config.get("output", {})
+    png_compress_level = output_config.get("png_compress_level", 6)
+    fast_render = output_config.get("fast_render", False)
+    palette_output = output_config.get("palette_output", False)
+
     hologram_config = config.get("hologram", {})
     hologram_enabled = hologram_config.get("enabled", True)
     hologram_opacity = hologram_config.get("opacity", 0.15)
@@ -105,25 +111,38 @@ def main() -> int:
     # Fetch GitHub stats (or load from cache)
     print("\n[2/4] Fetching GitHub stats...")
     stats = None
+    sprites = None
+    pokemon_fetcher = PokemonFetcher(
+        cache_path=project_root / "output" / "pokemon_cache.pkl"
+    )
 
     if args.cache and cache_path.exists():
         # Load stats from cache
         try:
-            with open(cache_path, "r") as f:
-                stats = json.load(f)
+            with open(cache_path, "rb") as f:
+                stats = orjson.loads(f.read())
             print("  (Using cached stats)")
-        except (json.JSONDecodeError, IOError) as e:
+        except (orjson.JSONDecodeError, IOError) as e:
             print(f"  Warning: Could not load cache ({e}), fetching fresh stats...")
 
     if stats is None:
-        # Fetch fresh stats from GitHub API
+        # Fetch fresh stats from GitHub API. The sprite fetch hits an
+        # independent API, so run both concurrently and pay only the
+        # slower of the two latencies.
         try:
             github = GitHubStats(github_username)
-            stats = github.get_all_stats(excluded_languages=excluded_languages)
+            github.set_excluded_languages(excluded_languages)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                f_stats = executor.submit(github.get_all_stats)
+                f_sprites = executor.submit(
+                    pokemon_fetcher.get_team_sprites, pokemon_team
+                )
+                stats = f_stats.result()
+                sprites = f_sprites.result()
             # Save to cache for future use
             cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, "w") as f:
-                json.dump(stats, f, indent=2)
+            with open(cache_path, "wb") as f:
+                f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2))
         except Exception as e:
             print(f"Error fetching GitHub stats: {e}")
             return 1
@@ -143,10 +162,10 @@ def main() -> int:
         f"  Top languages: {', '.join(f'{lang} ({pct}%)' for lang, pct in stats['languages'])}"
     )
 
-    # Fetch Pokemon sprites
+    # Fetch Pokemon sprites (already done above unless stats came from cache)
     print("\n[3/4] Fetching Pokemon sprites...")
-    pokemon_fetcher = PokemonFetcher()
-    sprites = pokemon_fetcher.get_team_sprites(pokemon_team)
+    if sprites is None:
+        sprites = pokemon_fetcher.get_team_sprites(pokemon_team)
     fetched_count = sum(1 for s in sprites if s is not None)
     print(f"  Fetched {fetched_count}/{len(pokemon_team)} sprites")
 
@@ -167,6 +186,9 @@ def main() -> int:
         hologram_enabled=hologram_enabled,
         hologram_opacity=hologram_opacity,
         hologram_apply_to_profile=hologram_apply_to_profile,
+        png_compress_level=png_compress_level,
+        fast_scale=fast_render,
+        palette_output=palette_output,
     )
     renderer.render(
         sprites,
@@ -1,8 +1,12 @@
 """PokeAPI client for fetching Pokemon sprites."""
 
+import asyncio
+import pickle
 from io import BytesIO
+from pathlib import Path
 
-import requests
+import aiohttp
+import orjson
 from PIL import Image
 
 
@@ -10,16 +14,71 @@ class PokemonFetcher:
     """Fetches Pokemon sprites from PokeAPI."""
 
     API_URL = "https://pokeapi.co/api/v2/pokemon"
+    SPRITE_URLS_PATH = Path(__file__).parent / "assets" / "sprite_urls.json"
+
+    def __init__(self, cache_path: str | Path | None = None):
+        # Prebuilt name -> sprite URL lookup (scripts/prebuild_pokemon_urls.py)
+        # so known team members skip the /pokemon/{name} metadata request.
+        self._sprite_urls: dict[str, dict[str, str | None]] = {}
+        if self.SPRITE_URLS_PATH.exists():
+            try:
+                self._sprite_urls = orjson.loads(self.SPRITE_URLS_PATH.read_bytes())
+            except (OSError, orjson.JSONDecodeError):
+                self._sprite_urls = {}
+        # Raw PNG bytes per cache key; decoding happens lazily on each hit so
+        # the cache never holds (or defensively copies) full RGBA buffers.
+        self.sprite_cache: dict[str, bytes] = {}
+
+        # On-disk cache of {cache_key: (etag, png_bytes)} so warm runs can
+        # revalidate sprites with If-None-Match instead of re-downloading.
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._disk_cache: dict[str, tuple[str, bytes]] = self._load_disk_cache()
+        self._disk_cache_dirty = False
+
+    def _load_disk_cache(self) -> dict[str, tuple[str, bytes]]:
+        """Load the pickled ETag/bytes cache from disk, if present."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached = pickle.load(f)
+            return cached if isinstance(cached, dict) else {}
+        except (OSError, pickle.PickleError, EOFError):
+            return {}
+
+    def _save_disk_cache(self) -> None:
+        """Persist the ETag/bytes cache to disk if anything changed."""
+        if self.cache_path is None or not self._disk_cache_dirty:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, "wb") as f:
+                pickle.dump(self._disk_cache, f)
+            self._disk_cache_dirty = False
+        except OSError as e:
+            print(f"Warning: could not save sprite cache: {e}")
+
+    @staticmethod
+    def _decode_sprite(content: bytes) -> Image.Image:
+        """
+        Decode PNG bytes into a fresh RGBA image.
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.sprite_cache: dict[str, Image.Image] = {}
-
-    def get_pokemon_sprite(self, pokemon_name: str, shiny: bool = False) -> Image.Image | None:
+        Each call produces an independent image, so cache hits never need a
+        defensive deep copy and callers are free to mutate what they get.
+        """
+        image = Image.open(BytesIO(content))
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        return image
+
+    async def _fetch_one(
+        self, session: aiohttp.ClientSession, pokemon_name: str, shiny: bool = False
+    ) -> Image.Image | None:
         """
         Fetch a Pokemon's sprite image.
 
         Args:
+            session: Shared aiohttp session for both API and sprite requests
             pokemon_name: The name of the Pokemon (lowercase)
             shiny: Whether to fetch the shiny sprite variant
 
@@ -29,57 +88,87 @@ class PokemonFetcher:
         pokemon_name = pokemon_name.lower().strip()
         cache_key = f"{pokemon_name}_shiny" if shiny else pokemon_name
 
-        # Check cache first
+        # Check cache first (yield so cache hits stay cooperative)
         if cache_key in self.sprite_cache:
-            return self.sprite_cache[cache_key].copy()
+            await asyncio.sleep(0)
+            return self._decode_sprite(self.sprite_cache[cache_key])
 
         try:
-            # Get Pokemon data from PokeAPI
-            response = self.session.get(
-                f"{self.API_URL}/{pokemon_name}",
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Get the game sprite (pixel art style)
-            sprites = data.get("sprites", {})
             sprite_key = "front_shiny" if shiny else "front_default"
-            sprite_url = sprites.get(sprite_key)
+            prebuilt = self._sprite_urls.get(pokemon_name)
+
+            if prebuilt is not None:
+                # Sprite URL resolved at build time: no metadata round trip
+                sprite_url = prebuilt.get(sprite_key)
+            else:
+                # Get Pokemon data from PokeAPI
+                async with session.get(f"{self.API_URL}/{pokemon_name}") as response:
+                    response.raise_for_status()
+                    data = orjson.loads(await response.read())
+
+                # Get the game sprite (pixel art style)
+                sprites = data.get("sprites", {})
+                sprite_url = sprites.get(sprite_key)
 
             if not sprite_url:
                 print(f"No {'shiny ' if shiny else ''}sprite found for {pokemon_name}")
                 return None
 
-            # Download the sprite image
-            sprite_response = self.session.get(sprite_url, timeout=30)
-            sprite_response.raise_for_status()
+            # Download the sprite image, revalidating against the disk cache
+            # so an unchanged sprite costs a 304 instead of the full body.
+            cached = self._disk_cache.get(cache_key)
+            headers = {"If-None-Match": cached[0]} if cached else {}
 
-            # Convert to PIL Image
-            image = Image.open(BytesIO(sprite_response.content))
+            async with session.get(sprite_url, headers=headers) as sprite_response:
+                if sprite_response.status == 304 and cached:
+                    content = cached[1]
+                else:
+                    sprite_response.raise_for_status()
+                    content = await sprite_response.read()
+                    etag = sprite_response.headers.get("ETag")
+                    if etag:
+                        self._disk_cache[cache_key] = (etag, content)
+                        self._disk_cache_dirty = True
 
-            # Convert to RGBA if not already
-            if image.mode != "RGBA":
-                image = image.convert("RGBA")
+            # Cache the raw bytes; decode only the copy we hand back
+            self.sprite_cache[cache_key] = content
 
-            # Cache the sprite
-            self.sprite_cache[cache_key] = image.copy()
+            return self._decode_sprite(content)
 
-            return image
-
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             print(f"Error fetching Pokemon {pokemon_name}: {e}")
             return None
         except Exception as e:
             print(f"Unexpected error for {pokemon_name}: {e}")
             return None
 
+    async def _fetch_all(self, team: list[tuple[str, bool]]) -> list[Image.Image | None]:
+        """Fetch all team sprites concurrently over one shared session."""
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            return await asyncio.gather(
+                *(self._fetch_one(session, name, shiny) for name, shiny in team)
+            )
+
+    def get_pokemon_sprite(self, pokemon_name: str, shiny: bool = False) -> Image.Image | None:
+        """Fetch a single Pokemon's sprite image (synchronous convenience wrapper)."""
+        return self._run_fetch([(pokemon_name, shiny)])[0]
+
+    def _run_fetch(self, team: list[tuple[str, bool]]) -> list[Image.Image | None]:
+        """Run the async fetch for a (name, shiny) team list."""
+        sprites = asyncio.run(self._fetch_all(team))
+        self._save_disk_cache()
+        return sprites
+
     def get_team_sprites(
         self, team: list[str | dict], sprite_size: tuple[int, int] = (96, 96)
     ) -> list[Image.Image | None]:
         """
         Fetch sprites for a team of Pokemon.
 
+        All network requests run concurrently via asyncio; the PIL resize and
+        compositing work happens afterwards on the main thread.
+
         Args:
             team: List of Pokemon names (strings) or dicts with 'name' and optional 'shiny' keys
             sprite_size: Size to resize sprites to (width, height)
@@ -87,30 +176,40 @@ class PokemonFetcher:
         Returns:
             List of PIL Images (or None for failed fetches)
         """
-        sprites = []
-
+        # Support both string format and dict format with shiny option
+        requested: list[tuple[str, bool]] = []
         for pokemon in team:
-            # Support both string format and dict format with shiny option
             if isinstance(pokemon, dict):
-                pokemon_name = pokemon.get("name", "")
-                shiny = pokemon.get("shiny", False)
+                requested.append((pokemon.get("name", ""), pokemon.get("shiny", False)))
             else:
-                pokemon_name = pokemon
-                shiny = False
+                requested.append((pokemon, False))
 
-            sprite = self.get_pokemon_sprite(pokemon_name, shiny=shiny)
+        fetched = self._run_fetch(requested)
 
+        # One shared placeholder template, copied per miss instead of
+        # rebuilding the same gray canvas from scratch each time.
+        placeholder: Image.Image | None = None
+
+        sprites = []
+        for sprite in fetched:
             if sprite:
                 # Scale up pixel art using nearest neighbor to preserve crisp pixels
                 # Game sprites are typically 96x96, scale to target size
                 scale_factor = min(sprite_size[0] / sprite.width, sprite_size[1] / sprite.height)
                 new_width = int(sprite.width * scale_factor)
                 new_height = int(sprite.height * scale_factor)
-                
-                sprite = sprite.resize(
-                    (new_width, new_height),
-                    Image.Resampling.NEAREST  # Preserve pixel art look
-                )
+
+                if (new_width, new_height) != sprite.size:
+                    sprite = sprite.resize(
+                        (new_width, new_height),
+                        Image.Resampling.NEAREST  # Preserve pixel art look
+                    )
+
+                # Exact fit (the common case for square game sprites): no
+                # centering canvas needed, skip the extra allocation + paste.
+                if sprite.size == sprite_size:
+                    sprites.append(sprite)
+                    continue
 
                 # Create a new image with the exact size and paste the sprite centered
                 new_sprite = Image.new("RGBA", sprite_size, (0, 0, 0, 0))
@@ -121,9 +220,9 @@ class PokemonFetcher:
                 new_sprite.paste(sprite, offset, sprite)
                 sprites.append(new_sprite)
             else:
-                # Create a placeholder for missing sprites
-                placeholder = Image.new("RGBA", sprite_size, (128, 128, 128, 100))
-                sprites.append(placeholder)
+                # Copy a shared placeholder for missing sprites
+                if placeholder is None:
+                    placeholder = Image.new("RGBA", sprite_size, (128, 128, 128, 100))
+                sprites.append(placeholder.copy())
 
         return sprites
-
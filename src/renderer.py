@@ -1,8 +1,15 @@
 """Image renderer for the GitHub stats card."""
 
+import functools
+import io
+import math
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import accumulate
 from pathlib import Path
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from language_colors import GITHUB_LANGUAGE_COLORS
@@ -13,19 +20,29 @@ FALLBACK_LANGUAGE_COLORS = [
     "#56b6c2", "#be5046", "#d19a66", "#abb2bf", "#5c6370",
 ]
 
+# Lowercased view of GitHub's palette, built once so case-insensitive lookups
+# are O(1) instead of a scan over ~400 entries per call
+_GITHUB_LANG_LOWER = {k.lower(): v for k, v in GITHUB_LANGUAGE_COLORS.items()}
+
+# Single-pass ASCII downcasing table; casefold stays the fallback for the
+# rare non-ASCII language name
+_ASCII_LOWER_TABLE = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"
+)
+
 
 def get_language_color(language: str, fallback_index: int = 0) -> str:
     """Get the GitHub color for a language, with fallback for unknown languages."""
     # Try exact match first
-    if language in GITHUB_LANGUAGE_COLORS:
-        return GITHUB_LANGUAGE_COLORS[language]
-    
+    color = GITHUB_LANGUAGE_COLORS.get(language)
+    if color is not None:
+        return color
+
     # Try case-insensitive match
-    language_lower = language.lower()
-    for lang, color in GITHUB_LANGUAGE_COLORS.items():
-        if lang.lower() == language_lower:
-            return color
-    
+    color = _GITHUB_LANG_LOWER.get(language.lower())
+    if color is not None:
+        return color
+
     # Return a fallback color based on the index
     return FALLBACK_LANGUAGE_COLORS[fallback_index % len(FALLBACK_LANGUAGE_COLORS)]
 
@@ -42,6 +59,204 @@ def hex_to_rgba(hex_color: str, alpha: int = 255) -> tuple[int, int, int, int]:
     return (r, g, b, alpha)
 
 
+def _blend_array(c1: np.ndarray, c2: np.ndarray, f: np.ndarray) -> np.ndarray:
+    """Linearly interpolate between two RGBA colors for an array of factors.
+
+    `f` has one factor per output row; the result is (len(f), 4) float32,
+    left unrounded so callers can keep compositing before the uint8 cast.
+    """
+    return c1 + (c2 - c1) * f[:, None]
+
+
+@functools.lru_cache(maxsize=256)
+def _language_rgba(language: str, fallback_index: int) -> tuple[int, int, int, int]:
+    """RGBA for a language's GitHub color, memoized on (language, index).
+
+    The bar and the legend resolve the same colors back to back; caching the
+    combined lookup + hex parse means each pair is computed once per process.
+    """
+    return hex_to_rgba(get_language_color(language, fallback_index))
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Container geometry in output pixels, scaled once at construction.
+
+    The mockup coordinates (header box at 236,24 555x84; speech bubble at
+    22,209 200x169; profile at 122,101 100x100) live here so the draw
+    helpers share one source of truth instead of re-scaling their own copies
+    every render.
+    """
+
+    header_rect: tuple[int, int, int, int]
+    header_radius: int
+    bubble_rect: tuple[int, int, int, int]
+    bubble_radius: int
+    profile_xy: tuple[int, int]
+    profile_size: int
+    profile_radius: int
+
+
+# Optional numba-compiled kernel for the balanced-wrap DP. Only worth the JIT
+# warm-up for very long blurbs, so _wrap_text_balanced gates on word count;
+# the pure-Python recurrence below remains the default path.
+try:
+    import numba
+
+    @numba.njit(cache=True)
+    def _wrap_dp_kernel(
+        prefix_widths: "np.ndarray", space_width: float, max_width: float
+    ) -> "tuple[float, np.ndarray]":
+        n = prefix_widths.shape[0]
+        inf = 1e18
+        cost = np.full(n + 1, inf)
+        breaks = np.full(n, n, dtype=np.int64)
+        cost[n] = 0.0
+        for i in range(n - 1, -1, -1):
+            for j in range(i + 1, n + 1):
+                width = prefix_widths[j - 1]
+                if i > 0:
+                    width -= prefix_widths[i - 1]
+                width += space_width * (j - i - 1)
+                if width > max_width:
+                    break
+                remaining = max_width - width
+                total = remaining * remaining + cost[j]
+                if total < cost[i]:
+                    cost[i] = total
+                    breaks[i] = j
+        return cost[0], breaks
+
+except ImportError:
+    _wrap_dp_kernel = None
+
+# Past this many words the DP's O(n * line_len) Python loop dominates wrap
+# time and the compiled kernel pays for itself.
+_WRAP_DP_JIT_THRESHOLD = 200
+
+
+# Candidate font locations - Source Sans Pro preferred, resolved once per process
+_ASSETS_DIR = Path(__file__).parent / "assets"
+
+_REGULAR_FONT_PATHS = [
+    # Local assets folder (bundled with project)
+    _ASSETS_DIR / "SourceSans3-Regular.otf",
+    # macOS - Source Sans Pro
+    "/Library/Fonts/SourceSans3-Regular.otf",
+    "/Library/Fonts/SourceSansPro-Regular.ttf",
+    "/System/Library/Fonts/Supplemental/SourceSansPro-Regular.otf",
+    # Linux - Source Sans Pro
+    "/usr/share/fonts/truetype/source-sans-pro/SourceSansPro-Regular.ttf",
+    "/usr/share/fonts/opentype/source-sans-pro/SourceSansPro-Regular.otf",
+    # Windows - Source Sans Pro
+    "C:/Windows/Fonts/SourceSansPro-Regular.ttf",
+    # Fallbacks
+    "/System/Library/Fonts/SFNSMono.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "C:/Windows/Fonts/segoeui.ttf",
+]
+
+_BOLD_FONT_PATHS = [
+    # Local assets folder (bundled with project)
+    _ASSETS_DIR / "SourceSans3-Bold.otf",
+    # macOS - Source Sans Pro Bold
+    "/Library/Fonts/SourceSans3-Bold.otf",
+    "/Library/Fonts/SourceSansPro-Bold.ttf",
+    "/System/Library/Fonts/Supplemental/SourceSansPro-Bold.otf",
+    # Linux - Source Sans Pro Bold
+    "/usr/share/fonts/truetype/source-sans-pro/SourceSansPro-Bold.ttf",
+    "/usr/share/fonts/opentype/source-sans-pro/SourceSansPro-Bold.otf",
+    # Windows - Source Sans Pro Bold
+    "C:/Windows/Fonts/SourceSansPro-Bold.ttf",
+    # Fallbacks
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "C:/Windows/Fonts/segoeuib.ttf",
+]
+
+# Font path resolution stats the whole candidate list, and every
+# ImageFont.truetype call re-reads and re-parses the font file, so both are
+# cached for the life of the process (fonts are immutable in PIL). The raw
+# file bytes are read once and shared across all sizes so FreeType works off
+# one backing buffer instead of six separate disk reads.
+_FONT_PATH_CACHE: dict[bool, Path | None] = {}
+_FONT_BYTES_CACHE: dict[str, bytes] = {}
+_FONT_CACHE: dict[tuple[str, int], ImageFont.FreeTypeFont] = {}
+# Candidates that exist on disk but failed to parse; skipped on re-resolution
+_FONT_BAD_PATHS: set[str] = set()
+
+
+# Resized sprites keyed by source image identity, so repeat renders of the
+# same team skip the NEAREST resize. PIL images define __eq__ without
+# __hash__ and so cannot key a WeakKeyDictionary; instead each entry is keyed
+# by id() and evicted via weakref.finalize when its source is collected,
+# which also keeps a recycled id from ever hitting a stale entry.
+_SPRITE_RESIZE_CACHE: dict[int, dict[tuple[int, int], Image.Image]] = {}
+
+
+def _resize_sprite_cached(sprite: Image.Image, size: tuple[int, int]) -> Image.Image:
+    """Resize a sprite with NEAREST, reusing the result for the same source."""
+    sprite_id = id(sprite)
+    per_sprite = _SPRITE_RESIZE_CACHE.get(sprite_id)
+    if per_sprite is None:
+        per_sprite = {}
+        _SPRITE_RESIZE_CACHE[sprite_id] = per_sprite
+        weakref.finalize(sprite, _SPRITE_RESIZE_CACHE.pop, sprite_id, None)
+
+    resized = per_sprite.get(size)
+    if resized is None:
+        resized = sprite.resize(size, Image.Resampling.NEAREST)
+        per_sprite[size] = resized
+    return resized
+
+
+def _resolve_font_path(bold: bool) -> Path | None:
+    """Find the first available font file, scanning the candidates only once."""
+    if bold not in _FONT_PATH_CACHE:
+        resolved = None
+        for font_path in (_BOLD_FONT_PATHS if bold else _REGULAR_FONT_PATHS):
+            path = Path(font_path)
+            if str(path) not in _FONT_BAD_PATHS and path.exists():
+                resolved = path
+                break
+        _FONT_PATH_CACHE[bold] = resolved
+    return _FONT_PATH_CACHE[bold]
+
+
+def _load_font_cached(
+    size: int, bold: bool = False
+) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Load a font at the given size, reusing previously opened fonts."""
+    while True:
+        path = _resolve_font_path(bold)
+
+        if path is None:
+            # Bold falls back to regular, regular to PIL's default bitmap font
+            return _load_font_cached(size) if bold else ImageFont.load_default()
+
+        key = (str(path), size)
+        font = _FONT_CACHE.get(key)
+        if font is not None:
+            return font
+
+        try:
+            data = _FONT_BYTES_CACHE.get(key[0])
+            if data is None:
+                data = path.read_bytes()
+                _FONT_BYTES_CACHE[key[0]] = data
+            font = ImageFont.truetype(io.BytesIO(data), size)
+        except OSError:
+            # Unreadable or corrupt candidate: blacklist it, drop its stale
+            # caches, and re-resolve to the next candidate on the list
+            _FONT_BAD_PATHS.add(key[0])
+            _FONT_BYTES_CACHE.pop(key[0], None)
+            _FONT_PATH_CACHE.pop(bold, None)
+            continue
+
+        _FONT_CACHE[key] = font
+        return font
+
+
 class StatsCardRenderer:
     """Renders the GitHub stats card as a PNG image."""
 
@@ -62,6 +277,39 @@ class StatsCardRenderer:
     BASE_LANGUAGE_BAR_WIDTH = 11
     BASE_LANGUAGE_BAR_HEIGHT = 201
 
+    # Unit 5-pointed star outline as (cos, sin, radius factor) per vertex,
+    # starting from the top; the trig runs once at import instead of per icon
+    _STAR_UNIT = tuple(
+        (
+            math.cos(math.radians(i * 36 - 90)),
+            math.sin(math.radians(i * 36 - 90)),
+            1.0 if i % 2 == 0 else 0.4,
+        )
+        for i in range(10)
+    )
+
+    # Rainbow gradient palette for the username, converted to RGBA once
+    _GRADIENT_RGBA = (
+        hex_to_rgba("#ff6b6b"),  # Red
+        hex_to_rgba("#ffa94d"),  # Orange
+        hex_to_rgba("#ffd43b"),  # Yellow
+        hex_to_rgba("#69db7c"),  # Green
+        hex_to_rgba("#4dabf7"),  # Blue
+        hex_to_rgba("#9775fa"),  # Purple
+        hex_to_rgba("#f783ac"),  # Pink
+    )
+
+    # Diagonal etch lines in the bottom-right corner, mockup coordinates on
+    # the base 800x400 card (shortest first, nearest the corner)
+    _ETCH_LINES_BASE = (
+        ((791.375, 369.331), (776.375, 386.331)),
+        ((791.367, 359.34), (766.367, 386.34)),
+        ((791.354, 349.354), (754.354, 386.354)),
+    )
+
+    # Upper bound for the finished language-bar cache
+    _BAR_IMG_CACHE_MAX = 32
+
     def __init__(
         self,
         theme: dict[str, str],
@@ -69,12 +317,23 @@ class StatsCardRenderer:
         hologram_enabled: bool = True,
         hologram_opacity: float = 0.15,
         hologram_apply_to_profile: bool = False,
+        png_compress_level: int = 6,
+        fast_scale: bool = False,
+        palette_output: bool = False,
     ):
         self.theme = theme
         self.hologram_enabled = hologram_enabled
         self.hologram_opacity = max(0.0, min(1.0, hologram_opacity))  # Clamp to 0-1
         self.hologram_apply_to_profile = hologram_apply_to_profile
-        
+        # zlib level for the PNG encoder. The default 6 matches Pillow; level
+        # 1 encodes ~3-5x faster at a slightly larger file, which is the
+        # better trade for dev iterations and CI runs.
+        self.png_compress_level = max(0, min(9, int(png_compress_level)))
+        # Quantize the finished card to a 256-color palette before saving.
+        # The card is mostly flat theme colors, so the dithered P-mode PNG is
+        # both smaller and cheaper to encode than full RGBA.
+        self.palette_output = bool(palette_output)
+
         # Rendering scale multiplier. 2.0 => 1600x800 output while keeping the same layout.
         # Clamp to a sane minimum to avoid 0-sized assets if misconfigured.
         try:
@@ -84,6 +343,15 @@ class StatsCardRenderer:
         if self.scale <= 0:
             self.scale = 2.0
 
+        # Fast mode rasterizes every primitive at 1x (scale^2 fewer pixels
+        # touched) and upsamples the finished card once with LANCZOS. Text
+        # comes out slightly softer than a native-scale render, so this is
+        # opt-in for dev/batch runs rather than the default.
+        self.output_scale = self.scale
+        self.fast_scale = bool(fast_scale) and self.scale > 1.0
+        if self.fast_scale:
+            self.scale = 1.0
+
         # Scaled dimensions
         self.CARD_WIDTH = self._s(self.BASE_CARD_WIDTH)
         self.CARD_HEIGHT = self._s(self.BASE_CARD_HEIGHT)
@@ -114,6 +382,42 @@ class StatsCardRenderer:
             theme.get("language_bar_border", "#ffffff")
         )
         
+        # Container geometry, scaled from mockup coordinates once up front
+        self.layout = Layout(
+            header_rect=(
+                self._s(236), self._s(24), self._s(236 + 555), self._s(24 + 84),
+            ),
+            header_radius=self._s(40),
+            bubble_rect=(
+                self._s(22), self._s(209), self._s(22 + 200), self._s(209 + 169),
+            ),
+            bubble_radius=self._s(20),
+            profile_xy=(self._s(122), self._s(101)),
+            profile_size=self._s(100),
+            profile_radius=self._s(23),
+        )
+
+        # Decorative etch lines (bottom-right corner), scaled from mockup
+        # coordinates once; the color and width are fixed per instance too
+        self._etch_color = hex_to_rgba("#E5E5E5", int(255 * 0.7))
+        self._etch_line_width = max(1, self._s(1))
+        self._etch_lines_scaled = [
+            ((self._s(x1), self._s(y1)), (self._s(x2), self._s(y2)))
+            for (x1, y1), (x2, y2) in self._ETCH_LINES_BASE
+        ]
+
+        # Rounded masks for the language bar, keyed (w, h, radius); the
+        # geometry is fixed per card so each mask rasterizes once
+        self._bar_mask_cache: dict[tuple[int, int, int], Image.Image] = {}
+
+        # Measured text widths keyed (text, font); legend labels repeat
+        # across renders, so each (string, font) pair is measured once
+        self._text_width_cache: dict[tuple[str, int], int] = {}
+
+        # Finished language-bar images keyed on languages + render flags;
+        # repeat renders of the same stats skip the whole bar build
+        self._bar_img_cache: dict[tuple, Image.Image] = {}
+
         # Load hologram pattern for overlay effect (only if enabled)
         self.hologram_pattern = self._load_hologram_pattern() if self.hologram_enabled else None
 
@@ -186,73 +490,11 @@ class StatsCardRenderer:
 
     def _load_font(self, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         """Load a font, with fallbacks."""
-        # Get the assets directory relative to this file
-        assets_dir = Path(__file__).parent / "assets"
-        
-        # Common font paths to try - Source Sans Pro preferred
-        font_paths = [
-            # Local assets folder (bundled with project)
-            assets_dir / "SourceSans3-Regular.otf",
-            # macOS - Source Sans Pro
-            "/Library/Fonts/SourceSans3-Regular.otf",
-            "/Library/Fonts/SourceSansPro-Regular.ttf",
-            "/System/Library/Fonts/Supplemental/SourceSansPro-Regular.otf",
-            # Linux - Source Sans Pro
-            "/usr/share/fonts/truetype/source-sans-pro/SourceSansPro-Regular.ttf",
-            "/usr/share/fonts/opentype/source-sans-pro/SourceSansPro-Regular.otf",
-            # Windows - Source Sans Pro
-            "C:/Windows/Fonts/SourceSansPro-Regular.ttf",
-            # Fallbacks
-            "/System/Library/Fonts/SFNSMono.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "C:/Windows/Fonts/segoeui.ttf",
-        ]
-
-        for font_path in font_paths:
-            path = Path(font_path)
-            if path.exists():
-                try:
-                    return ImageFont.truetype(str(path), size)
-                except OSError:
-                    continue
-
-        # Fallback to default font
-        return ImageFont.load_default()
+        return _load_font_cached(size)
 
     def _load_font_bold(self, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         """Load a bold font, with fallbacks."""
-        # Get the assets directory relative to this file
-        assets_dir = Path(__file__).parent / "assets"
-        
-        # Bold font paths to try - Source Sans Pro Bold preferred
-        font_paths = [
-            # Local assets folder (bundled with project)
-            assets_dir / "SourceSans3-Bold.otf",
-            # macOS - Source Sans Pro Bold
-            "/Library/Fonts/SourceSans3-Bold.otf",
-            "/Library/Fonts/SourceSansPro-Bold.ttf",
-            "/System/Library/Fonts/Supplemental/SourceSansPro-Bold.otf",
-            # Linux - Source Sans Pro Bold
-            "/usr/share/fonts/truetype/source-sans-pro/SourceSansPro-Bold.ttf",
-            "/usr/share/fonts/opentype/source-sans-pro/SourceSansPro-Bold.otf",
-            # Windows - Source Sans Pro Bold
-            "C:/Windows/Fonts/SourceSansPro-Bold.ttf",
-            # Fallbacks
-            "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "C:/Windows/Fonts/segoeuib.ttf",
-        ]
-
-        for font_path in font_paths:
-            path = Path(font_path)
-            if path.exists():
-                try:
-                    return ImageFont.truetype(str(path), size)
-                except OSError:
-                    continue
-
-        # Fallback to regular font
-        return self._load_font(size)
+        return _load_font_cached(size, bold=True)
 
     def _draw_rounded_rectangle(
         self,
@@ -262,49 +504,25 @@ class StatsCardRenderer:
         fill: tuple[int, int, int, int],
     ) -> None:
         """Draw a rounded rectangle."""
-        x1, y1, x2, y2 = xy
-
-        # Draw the main rectangle
-        draw.rectangle([x1 + radius, y1, x2 - radius, y2], fill=fill)
-        draw.rectangle([x1, y1 + radius, x2, y2 - radius], fill=fill)
-
-        # Draw the four corners
-        draw.pieslice([x1, y1, x1 + radius * 2, y1 + radius * 2], 180, 270, fill=fill)
-        draw.pieslice(
-            [x2 - radius * 2, y1, x2, y1 + radius * 2], 270, 360, fill=fill
-        )
-        draw.pieslice(
-            [x1, y2 - radius * 2, x1 + radius * 2, y2], 90, 180, fill=fill
-        )
-        draw.pieslice([x2 - radius * 2, y2 - radius * 2, x2, y2], 0, 90, fill=fill)
+        # Pillow's own rounded_rectangle rasterizes the shape in one C call,
+        # replacing the old 2-rectangle + 4-pieslice construction.
+        draw.rounded_rectangle(xy, radius=radius, fill=fill)
 
     def _draw_layout_containers(self, draw: ImageDraw.ImageDraw) -> None:
         """Draw the structural layout containers."""
         # Header Box (Top Right)
-        # Rect: x=236, y=24, width=555, height=84
         self._draw_rounded_rectangle(
             draw,
-            (
-                self._s(236),
-                self._s(24),
-                self._s(236 + 555),
-                self._s(24 + 84),
-            ),
-            self._s(40),
+            self.layout.header_rect,
+            self.layout.header_radius,
             self.header_box_color,
         )
 
         # Speech Bubble Box (Bottom Left) - with tail pointing to profile image
-        # Rect: x=22, y=209, width=200, height=169
         self._draw_speech_bubble(
             draw,
-            (
-                self._s(22),
-                self._s(209),
-                self._s(22 + 200),
-                self._s(209 + 169),
-            ),
-            self._s(20),
+            self.layout.bubble_rect,
+            self.layout.bubble_radius,
             self.team_box_color,
         )
 
@@ -322,19 +540,18 @@ class StatsCardRenderer:
 
     def _draw_speech_bubble_tail(self, draw: ImageDraw.ImageDraw) -> None:
         """Draw the speech bubble tail on top of the profile image."""
-        # Bubble box position: x=22, y=209, width=200, height=169
-        y1 = self._s(209)  # Top of the bubble
-        
-        # Profile image is at x=122, y=101, size=100x100
-        # Profile center bottom: (172, 201) in base coords
-        # Bubble top is at y=209, so there's a small gap
-        
+        y1 = self.layout.bubble_rect[1]  # Top of the bubble
+
+        # Profile center bottom sits just above the bubble top, so there's a
+        # small gap for the tail to bridge
+
         # Tail parameters - a nice curved speech bubble pointer
         tail_height = self._s(12)  # Height of the tail (connects to profile)
-        
+
         # Position the tail to point toward the profile image center
-        # Profile center is at x=172 (122 + 50), tail should point there
-        tail_tip_x = self._s(172)  # Point directly at profile center
+        tail_tip_x = (
+            self.layout.profile_xy[0] + self.layout.profile_size // 2
+        )
         tail_base_left = self._s(145)  # Left edge of tail base on bubble
         tail_base_right = self._s(195)  # Right edge of tail base on bubble
         
@@ -409,7 +626,7 @@ class StatsCardRenderer:
         self._draw_speech_bubble_tail(draw)
 
         # Draw blurb section (bottom left container)
-        self._draw_blurb_section(image, blurb_lines or [])
+        self._draw_blurb_section(draw, blurb_lines or [])
 
         # Draw stats section (right side)
         self._draw_stats_section(image, draw, stats, labels)
@@ -420,47 +637,55 @@ class StatsCardRenderer:
         # Draw border
         self._draw_border(draw)
 
+        # In fast mode, upsample the 1x render to the requested output size
+        # in a single LANCZOS pass.
+        if self.fast_scale:
+            output_size = (
+                int(round(self.BASE_CARD_WIDTH * self.output_scale)),
+                int(round(self.BASE_CARD_HEIGHT * self.output_scale)),
+            )
+            image = image.resize(output_size, Image.Resampling.LANCZOS)
+
+        if self.palette_output:
+            # FASTOCTREE is the only built-in quantizer Pillow accepts for
+            # RGBA input (MEDIANCUT raises ValueError), and it keeps the
+            # card's transparent corners; dither= is ignored without an
+            # explicit palette, so it is not passed
+            image = image.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+
         # Save the image
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        image.save(output_path, "PNG")
+        image.save(
+            output_path,
+            "PNG",
+            compress_level=self.png_compress_level,
+            optimize=False,
+        )
         print(f"Stats card saved to {output_path}")
 
     def _draw_multicolor_text(
         self,
-        image: Image.Image,
+        draw: ImageDraw.ImageDraw,
         x: int,
         y: int,
         text: str,
         font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
     ) -> int:
         """Draw text with a rainbow gradient effect. Returns the width of the text."""
-        # Rainbow gradient colors
-        gradient_colors = [
-            "#ff6b6b",  # Red
-            "#ffa94d",  # Orange
-            "#ffd43b",  # Yellow
-            "#69db7c",  # Green
-            "#4dabf7",  # Blue
-            "#9775fa",  # Purple
-            "#f783ac",  # Pink
-        ]
-
-        draw = ImageDraw.Draw(image)
         current_x = x
         total_width = 0
 
         for i, char in enumerate(text):
-            # Cycle through gradient colors
-            color_idx = i % len(gradient_colors)
-            color = hex_to_rgba(gradient_colors[color_idx])
+            # Cycle through the precomputed gradient palette
+            color = self._GRADIENT_RGBA[i % len(self._GRADIENT_RGBA)]
 
             # Draw the character
             draw.text((current_x, y), char, font=font, fill=color)
 
-            # Get character width and move to next position
-            bbox = draw.textbbox((0, 0), char, font=font)
-            char_width = bbox[2] - bbox[0]
+            # Advance by the glyph's horizontal advance; getlength is a
+            # FreeType metrics lookup and skips the rasterization textbbox does
+            char_width = int(font.getlength(char))
             current_x += char_width
             total_width += char_width
 
@@ -487,7 +712,7 @@ class StatsCardRenderer:
         y += self._s(28)
 
         # Draw username in multicolor
-        self._draw_multicolor_text(image, x, y, username, self.username_font)
+        self._draw_multicolor_text(draw, x, y, username, self.username_font)
 
     def _draw_profile_image(
         self,
@@ -496,14 +721,17 @@ class StatsCardRenderer:
         apply_hologram: bool = False,
     ) -> None:
         """Draw the profile image with rounded corners, matching mockup position."""
-        # Mockup position: x=122, y=101, size=100x100, corner radius=23
-        x = self._s(122)
-        y = self._s(101)
-        size = self._s(100)
-        corner_radius = self._s(23)
+        x, y = self.layout.profile_xy
+        size = self.layout.profile_size
+        corner_radius = self.layout.profile_radius
 
-        # Resize profile image to target size
+        # Resize profile image to target size. Avatars are often much larger
+        # than the slot, so knock big sources down first with the integer box
+        # filter (cheap, SIMD-friendly) and let LANCZOS handle the final step.
         profile = profile_image.convert("RGBA")
+        factor = max(1, min(profile.size) // (2 * size))
+        if factor > 1:
+            profile = profile.reduce(factor)
         profile = profile.resize((size, size), Image.Resampling.LANCZOS)
 
         # Apply hologram overlay to profile if requested
@@ -584,26 +812,36 @@ class StatsCardRenderer:
             return []
 
         words = text.split()
-        lines: list[str] = []
-        current = ""
+        # Measure each word once; line widths are then just running sums of
+        # word advances plus spaces, so no joined candidate string is ever
+        # re-measured as the line grows.
+        word_widths = [font.getlength(w) for w in words]
+        space_width = font.getlength(" ")
 
-        for w in words:
-            candidate = f"{current} {w}".strip()
-            bbox = draw.textbbox((0, 0), candidate, font=font)
-            if (bbox[2] - bbox[0]) <= max_width:
-                current = candidate
+        lines: list[str] = []
+        current: list[str] = []
+        current_width = 0.0
+
+        for w, ww in zip(words, word_widths):
+            candidate_width = current_width + (space_width if current else 0) + ww
+            if candidate_width <= max_width:
+                current.append(w)
+                current_width = candidate_width
                 continue
 
             if current:
-                lines.append(current)
-                current = w
-            else:
+                lines.append(" ".join(current))
+            if ww > max_width:
                 # Extremely long single word: hard-break it.
                 lines.append(w)
-                current = ""
+                current = []
+                current_width = 0.0
+            else:
+                current = [w]
+                current_width = ww
 
         if current:
-            lines.append(current)
+            lines.append(" ".join(current))
 
         return lines
 
@@ -623,44 +861,54 @@ class StatsCardRenderer:
         if not words:
             return []
 
+        # Measure each word's advance once; any segment width is then an O(1)
+        # prefix-sum lookup instead of a fresh rasterization per (i, j) pair.
+        word_widths = [font.getlength(w) for w in words]
+        space_width = font.getlength(" ")
+
         # If a single word already exceeds the max width, fall back to greedy wrapping.
-        for word in words:
-            bbox = draw.textbbox((0, 0), word, font=font)
-            if (bbox[2] - bbox[0]) > max_width:
-                return self._wrap_text_to_width(draw, text, font, max_width)
+        if any(width > max_width for width in word_widths):
+            return self._wrap_text_to_width(draw, text, font, max_width)
 
         n = len(words)
-        widths_cache: dict[tuple[int, int], int] = {}
-
-        def line_width(i: int, j: int) -> int:
-            key = (i, j)
-            if key not in widths_cache:
-                segment = " ".join(words[i:j])
-                bbox = draw.textbbox((0, 0), segment, font=font)
-                widths_cache[key] = bbox[2] - bbox[0]
-            return widths_cache[key]
+        prefix_widths = list(accumulate(word_widths))
 
-        # Dynamic programming to minimize the raggedness between lines.
         inf = 10**18
-        cost = [inf] * (n + 1)
-        breaks = [n] * n
-        cost[n] = 0
-
-        for i in range(n - 1, -1, -1):
-            for j in range(i + 1, n + 1):
-                width = line_width(i, j)
-                if width > max_width:
-                    break
-                remaining = max_width - width
-                penalty = remaining * remaining
-                total = penalty + cost[j]
-                if total < cost[i]:
-                    cost[i] = total
-                    breaks[i] = j
-
-        # If we failed to find a layout, fall back to the greedy wrapper.
-        if cost[0] >= inf:
-            return self._wrap_text_to_width(draw, text, font, max_width)
+        if _wrap_dp_kernel is not None and n >= _WRAP_DP_JIT_THRESHOLD:
+            # Long blurb: hand the recurrence to the compiled kernel.
+            total_cost, breaks_arr = _wrap_dp_kernel(
+                np.asarray(prefix_widths, dtype=np.float64),
+                float(space_width),
+                float(max_width),
+            )
+            breaks = breaks_arr.tolist()
+            if total_cost >= 1e18:
+                return self._wrap_text_to_width(draw, text, font, max_width)
+        else:
+            def line_width(i: int, j: int) -> float:
+                width = prefix_widths[j - 1] - (prefix_widths[i - 1] if i else 0)
+                return width + space_width * (j - i - 1)
+
+            # Dynamic programming to minimize the raggedness between lines.
+            cost = [inf] * (n + 1)
+            breaks = [n] * n
+            cost[n] = 0
+
+            for i in range(n - 1, -1, -1):
+                for j in range(i + 1, n + 1):
+                    width = line_width(i, j)
+                    if width > max_width:
+                        break
+                    remaining = max_width - width
+                    penalty = remaining * remaining
+                    total = penalty + cost[j]
+                    if total < cost[i]:
+                        cost[i] = total
+                        breaks[i] = j
+
+            # If we failed to find a layout, fall back to the greedy wrapper.
+            if cost[0] >= inf:
+                return self._wrap_text_to_width(draw, text, font, max_width)
 
         lines: list[str] = []
         idx = 0
@@ -675,13 +923,11 @@ class StatsCardRenderer:
 
     def _draw_team_header(self, image: Image.Image, sprites: list[Image.Image | None]) -> None:
         """Draw the Pokemon team row inside the header box (top right container)."""
-        # Header container: x=236, y=24, w=555, h=84
-        container_x = self._s(236)
-        container_y = self._s(24)
-        container_w = self._s(555)
-        container_h = self._s(84)
-
-        draw = ImageDraw.Draw(image)
+        x1, y1, x2, y2 = self.layout.header_rect
+        container_x = x1
+        container_y = y1
+        container_w = x2 - x1
+        container_h = y2 - y1
 
         pad_x = self._s(24)
         # Sprites row, centered within the header container
@@ -707,37 +953,64 @@ class StatsCardRenderer:
         if total_needed < available_w:
             start_x = start_x + (available_w - total_needed) // 2
 
-        for i, sprite in enumerate(team):
-            x = start_x + i * (sprite_size + spacing)
-            if x + sprite_size > container_x + container_w - pad_x:
-                break
+        # Lay the row out in an off-screen strip first, then composite it onto
+        # the card with a single paste instead of one alpha composite per
+        # sprite. The sprites never overlap, so plain region copies suffice
+        # inside the strip.
+        strip = Image.new("RGBA", (total_needed, sprite_size), (0, 0, 0, 0))
 
+        for i, sprite in enumerate(team):
             if sprite.size != (sprite_size, sprite_size):
-                sprite = sprite.resize((sprite_size, sprite_size), Image.Resampling.NEAREST)
+                sprite = _resize_sprite_cached(sprite, (sprite_size, sprite_size))
 
-            image.paste(sprite, (x, sprite_y), sprite)
+            strip.paste(sprite, (i * (sprite_size + spacing), 0))
 
-    def _calculate_blurb_height(
+        image.paste(strip, (start_x, sprite_y), strip)
+
+    @staticmethod
+    def _line_height(
+        draw: ImageDraw.ImageDraw,
+        font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+    ) -> int:
+        """Line height for a font: ascent + descent, without rasterizing."""
+        if hasattr(font, "getmetrics"):
+            ascent, descent = font.getmetrics()
+            return ascent + descent
+        # Bitmap fallback fonts lack metrics; measure a representative sample
+        bbox = draw.textbbox((0, 0), "Ag", font=font)
+        return bbox[3] - bbox[1]
+
+    def _wrap_blurb(
         self,
         draw: ImageDraw.ImageDraw,
         blurb_lines: list[str],
         font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
         max_w: int,
+    ) -> list[list[str]]:
+        """Wrap every blurb paragraph for the given font."""
+        return [
+            self._wrap_text_balanced(draw, str(para), font, max_w)
+            for para in blurb_lines
+        ]
+
+    def _calculate_blurb_height(
+        self,
+        draw: ImageDraw.ImageDraw,
+        wrapped_paras: list[list[str]],
+        font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
         line_gap: int,
         para_gap: int,
     ) -> int:
-        """Calculate the total height needed to render blurb text with given font."""
+        """Calculate the total height needed to render pre-wrapped blurb text."""
+        line_h = self._line_height(draw, font)
         total_height = 0
-        for idx, para in enumerate(blurb_lines):
-            wrapped = self._wrap_text_balanced(draw, str(para), font, max_w)
+        for idx, wrapped in enumerate(wrapped_paras):
             for line in wrapped:
-                bbox = draw.textbbox((0, 0), line, font=font)
-                line_h = bbox[3] - bbox[1]
                 total_height += line_h + line_gap
             # Remove the last line_gap and add para_gap between paragraphs
             if wrapped:
                 total_height -= line_gap
-            if idx < len(blurb_lines) - 1:
+            if idx < len(wrapped_paras) - 1:
                 total_height += para_gap
         return total_height
 
@@ -747,37 +1020,53 @@ class StatsCardRenderer:
         blurb_lines: list[str],
         max_w: int,
         max_h: int,
-    ) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-        """Find the largest font size that fits the blurb text in the available space."""
+        wrap_cache: dict[int, list[list[str]]],
+    ) -> int:
+        """
+        Find the largest base font size that fits the blurb in the available
+        space. Wrap results are stored in `wrap_cache` keyed by base size so
+        the caller can reuse the winning layout without re-wrapping.
+        """
         # Font size range (in base coordinates, before scaling)
         min_size = 10
         max_size = 24
-        
-        best_font = self._load_font(self._s(min_size))
-        
-        for base_size in range(max_size, min_size - 1, -1):
-            font = self._load_font(self._s(base_size))
-            line_gap = self._s(4)
-            para_gap = self._s(8)
-            
+
+        line_gap = self._s(4)
+        para_gap = self._s(8)
+
+        # Height grows monotonically with font size, so binary search the
+        # largest size that still fits (~4 probes instead of up to 15).
+        lo, hi = min_size, max_size
+        best_size = min_size
+
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            font = self._load_font(self._s(mid))
+
+            wrapped_paras = wrap_cache.get(mid)
+            if wrapped_paras is None:
+                wrapped_paras = self._wrap_blurb(draw, blurb_lines, font, max_w)
+                wrap_cache[mid] = wrapped_paras
+
             total_height = self._calculate_blurb_height(
-                draw, blurb_lines, font, max_w, line_gap, para_gap
+                draw, wrapped_paras, font, line_gap, para_gap
             )
-            
+
             if total_height <= max_h:
-                return font
-        
-        return best_font
+                best_size = mid
+                lo = mid + 1
+            else:
+                hi = mid - 1
 
-    def _draw_blurb_section(self, image: Image.Image, blurb_lines: list[str]) -> None:
-        """Draw the blurb text in the bottom-left container (previously the team box)."""
-        # Bottom-left container: x=22, y=209, w=200, h=169
-        container_x = self._s(22)
-        container_y = self._s(209)
-        container_w = self._s(200)
-        container_h = self._s(169)
+        return best_size
 
-        draw = ImageDraw.Draw(image)
+    def _draw_blurb_section(self, draw: ImageDraw.ImageDraw, blurb_lines: list[str]) -> None:
+        """Draw the blurb text in the bottom-left container (previously the team box)."""
+        x1, y1, x2, y2 = self.layout.bubble_rect
+        container_x = x1
+        container_y = y1
+        container_w = x2 - x1
+        container_h = y2 - y1
 
         pad = self._s(20)
         x = container_x + pad
@@ -788,32 +1077,37 @@ class StatsCardRenderer:
         if not blurb_lines:
             return
 
-        # Find the optimal font size that fills the available space
-        font = self._find_optimal_blurb_font_size(draw, blurb_lines, max_w, max_h)
+        # Find the optimal font size that fills the available space, reusing
+        # the wrap computed during the fit search for the final render.
+        wrap_cache: dict[int, list[list[str]]] = {}
+        best_size = self._find_optimal_blurb_font_size(
+            draw, blurb_lines, max_w, max_h, wrap_cache
+        )
+        font = self._load_font(self._s(best_size))
+        wrapped_paras = wrap_cache.get(best_size) or self._wrap_blurb(
+            draw, blurb_lines, font, max_w
+        )
         line_gap = self._s(4)
         para_gap = self._s(8)
 
-        for idx, para in enumerate(blurb_lines):
-            wrapped = self._wrap_text_balanced(draw, str(para), font, max_w)
+        line_h = self._line_height(draw, font)
+
+        for idx, wrapped in enumerate(wrapped_paras):
             for line in wrapped:
-                bbox = draw.textbbox((0, 0), line, font=font)
-                line_h = bbox[3] - bbox[1]
                 draw.text((x, y), line, font=font, fill=self.text_color)
                 y += (line_h + line_gap)
             # Remove extra line_gap and add para_gap between paragraphs
             if wrapped:
                 y -= line_gap
-            if idx < len(blurb_lines) - 1:
+            if idx < len(wrapped_paras) - 1:
                 y += para_gap
 
     def _draw_star_icon(self, draw: ImageDraw.ImageDraw, cx: int, cy: int, size: int, color: tuple) -> None:
         """Draw a 5-pointed star icon centered at (cx, cy)."""
-        import math
-        points = []
-        for i in range(10):
-            angle = math.radians(i * 36 - 90)  # Start from top
-            r = size if i % 2 == 0 else size * 0.4
-            points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+        points = [
+            (cx + size * r * cos_a, cy + size * r * sin_a)
+            for cos_a, sin_a, r in self._STAR_UNIT
+        ]
         draw.polygon(points, fill=color)
 
     def _draw_commit_icon(self, draw: ImageDraw.ImageDraw, cx: int, cy: int, size: int, color: tuple) -> None:
@@ -889,9 +1183,12 @@ class StatsCardRenderer:
         labels = labels or {}
         stats_label = labels.get("stats", "stats")
         languages_label = labels.get("languages", "languages")
-        
-        x = self._s(290)
-        label_y = self._s(140)  # Section labels positioned above content
+
+        # Local binding skips the attribute lookup on every scale conversion
+        s = self._s
+
+        x = s(290)
+        label_y = s(140)  # Section labels positioned above content
         
         # Draw "stats" section label
         draw.text(
@@ -901,13 +1198,14 @@ class StatsCardRenderer:
             fill=self.secondary_color,
         )
         
-        y = self._s(180)  # Stats items start below section label
+        y = s(180)  # Stats items start below section label
 
         # Icon settings
-        icon_size = self._s(10)
+        icon_size = s(10)
         icon_x = x + icon_size  # Center point for icons
-        text_x = x + self._s(30)  # Text starts after icon
-        row_height = self._s(36)  # Spacing between rows
+        text_x = x + s(30)  # Text starts after icon
+        row_height = s(36)  # Spacing between rows
+        icon_offset = s(8)  # Vertical icon centering, same every row
 
         # Stats items in column layout: icon, value, label
         stats_items = [
@@ -925,7 +1223,7 @@ class StatsCardRenderer:
 
         for i, (icon_func, value, label, color) in enumerate(stats_items):
             item_y = y + i * row_height
-            icon_cy = item_y + self._s(8)  # Center icon vertically with text
+            icon_cy = item_y + icon_offset  # Center icon vertically with text
             
             # Draw the icon
             icon_func(draw, icon_x, icon_cy, icon_size, color)
@@ -941,10 +1239,10 @@ class StatsCardRenderer:
 
         # Vertical Bar for Languages
         # x=558, y=177, w=11, h=201
-        bar_x = self._s(558)
-        bar_y = self._s(180)  # Bar starts below label
-        bar_w = self._s(11)
-        bar_h = self._s(164)
+        bar_x = s(558)
+        bar_y = s(180)  # Bar starts below label
+        bar_w = s(11)
+        bar_h = s(164)
         
         languages: list[tuple[str, float]] = stats.get("languages", []) or []
         excluded_languages: list[str] = stats.get("excluded_languages", []) or []
@@ -954,7 +1252,7 @@ class StatsCardRenderer:
         if languages:
             # Draw "languages" section label ABOVE the bar
             draw.text(
-                (bar_x + self._s(30), label_y),
+                (bar_x + s(30), label_y),
                 languages_label,
                 font=self.body_font,
                 fill=self.secondary_color,
@@ -967,7 +1265,7 @@ class StatsCardRenderer:
             self._draw_vertical_language_bar(image, draw, bar_x, bar_y, bar_w, bar_h, languages, scale_bars, use_gradient, show_border)
             
             # Draw language legend to the right of the bar
-            self._draw_vertical_language_legend(draw, bar_x + self._s(30), bar_y, bar_h, languages)
+            self._draw_vertical_language_legend(draw, bar_x + s(30), bar_y, bar_h, languages)
 
     def _draw_vertical_language_bar(
         self,
@@ -991,133 +1289,212 @@ class StatsCardRenderer:
                          If False, draw solid color blocks with no blending.
             show_border: If True, draw a border around the language bar.
         """
-        # Background
-        draw.rounded_rectangle(
-            [x, y, x + w, y + h],
-            radius=max(1, w // 2),
-            fill=self.secondary_color
-        )
-        
         visible_languages = languages[:5]
-        if not visible_languages:
-            return
-        
         total_pct = sum(pct for _, pct in visible_languages)
-        if total_pct == 0:
+        if not visible_languages or total_pct == 0:
+            # Empty pill: the only case where the secondary background is
+            # visible, so it is drawn here instead of under every bar
+            draw.rounded_rectangle(
+                [x, y, x + w, y + h],
+                radius=max(1, w // 2),
+                fill=self.secondary_color,
+            )
             return
 
-        # Off-screen surface so we can apply a rounded mask to the fill
-        bar_img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-        bar_draw = ImageDraw.Draw(bar_img)
+        # The finished bar depends only on the languages and render flags,
+        # which rarely change between renders, so cache the composited image.
+        # Entries are normalized to tuples: cached stats arrive from orjson
+        # as lists, which are unhashable.
+        cache_key = (
+            tuple((lang, pct) for lang, pct in visible_languages),
+            scale_bars, use_gradient, show_border, w, h,
+        )
+        bar_img = self._bar_img_cache.get(cache_key)
+        if bar_img is None:
+            bar_img = self._build_bar_image(
+                w, h, visible_languages, total_pct, scale_bars, use_gradient
+            )
+            if bar_img is None:
+                # Degenerate segments (sub-pixel heights): show the empty pill
+                draw.rounded_rectangle(
+                    [x, y, x + w, y + h],
+                    radius=max(1, w // 2),
+                    fill=self.secondary_color,
+                )
+                return
+            if len(self._bar_img_cache) >= self._BAR_IMG_CACHE_MAX:
+                # FIFO eviction; insertion order is good enough here
+                self._bar_img_cache.pop(next(iter(self._bar_img_cache)))
+            self._bar_img_cache[cache_key] = bar_img
+
+        # In-place src-over composite: one pass, no separate mask argument
+        # for paste to re-read
+        image.alpha_composite(bar_img, (x, y))
+
+        # Draw border around the bar if enabled
+        if show_border:
+            border_width = max(1, self._s(1))
+            draw.rounded_rectangle(
+                [x, y, x + w, y + h],
+                radius=max(1, w // 2),
+                outline=self.language_bar_border_color,
+                width=border_width,
+            )
+
+    def _build_bar_image(
+        self,
+        w: int,
+        h: int,
+        visible_languages: list[tuple[str, float]],
+        total_pct: float,
+        scale_bars: bool,
+        use_gradient: bool,
+    ) -> Image.Image | None:
+        """Build the masked stacked-bar image for the given languages."""
+        # Rasterize the fill at base (1x) resolution and upscale once at the
+        # end: the fill is a pure vertical ramp, so BILINEAR reproduces it
+        # while the per-row work drops by the scale factor. The pill mask is
+        # still applied at full size to keep the edge crisp.
+        if self.scale > 1.0:
+            w0 = max(1, int(round(w / self.scale)))
+            h0 = max(1, int(round(h / self.scale)))
+            gradient_size = 8
+        else:
+            w0, h0 = w, h
+            gradient_size = self._s(8)
 
         # Calculate segment boundaries and colors
         segments: list[tuple[int, int, tuple[int, int, int, int]]] = []
         current_y = 0
         num_languages = len(visible_languages)
-        
+
         for i, (lang, percentage) in enumerate(visible_languages):
             if scale_bars:
                 # Proportional to actual percentage
-                segment_height = int((percentage / total_pct) * h)
+                segment_height = int((percentage / total_pct) * h0)
             else:
                 # Equal distribution for each language
-                segment_height = h // num_languages
+                segment_height = h0 // num_languages
                 # Give any remainder pixels to the last segment
                 if i == num_languages - 1:
-                    segment_height = h - current_y
+                    segment_height = h0 - current_y
             
             if segment_height < 1:
                 continue
             
-            color = hex_to_rgba(get_language_color(lang, i))
+            color = _language_rgba(lang, i)
             segments.append((current_y, current_y + segment_height, color))
             current_y += segment_height
         
         if not segments:
-            return
-        
+            return None
+
+        # A gradient between fewer than two segments is just a solid fill,
+        # so fall through to the rectangle path; short segments keep the
+        # gradient and shrink their blend zones instead (below)
+        if use_gradient and len(segments) < 2:
+            use_gradient = False
+
+        # The pill mask is fetched up front: the gradient path writes its
+        # alpha directly into the output array, the solid path applies it
+        # with putalpha after the fill
+        mask = self._bar_mask(w, h)
+
         if use_gradient:
-            # Size of gradient transition zone between segments (half on each side of boundary)
-            gradient_size = self._s(8)
-            
-            # Draw each row with gradient blending at transitions
-            for row_y in range(0, h):
-                # Find which segment(s) this row belongs to
-                row_color = None
-                
-                for seg_idx, (seg_start, seg_end, seg_color) in enumerate(segments):
-                    if seg_start <= row_y < seg_end:
-                        # Check if we're in a transition zone FROM the previous segment
-                        if seg_idx > 0:
-                            _, _, prev_color = segments[seg_idx - 1]
-                            dist_from_prev = row_y - seg_start
-                            
-                            if dist_from_prev < gradient_size:
-                                # Blend with previous segment's color (fading out)
-                                blend_factor = dist_from_prev / gradient_size
-                                row_color = self._blend_colors(prev_color, seg_color, blend_factor)
-                                break
-                        
-                        # Check if we're in a transition zone TO the next segment
-                        if seg_idx < len(segments) - 1:
-                            next_seg_start, _, next_color = segments[seg_idx + 1]
-                            dist_to_next = next_seg_start - row_y
-                            
-                            if dist_to_next <= gradient_size:
-                                # Blend with next segment's color (fading in)
-                                blend_factor = 1.0 - (dist_to_next / gradient_size)
-                                row_color = self._blend_colors(seg_color, next_color, blend_factor)
-                                break
-                        
-                        row_color = seg_color
-                        break
-                
-                if row_color is None:
-                    # Fallback to last segment color
-                    row_color = segments[-1][2] if segments else self.secondary_color
-                
-                # Draw the row
-                bar_draw.line([(0, row_y), (w, row_y)], fill=row_color)
+            # Build the per-row color ramp as an (h0, 4) float array: a
+            # repeat/gather maps every row to its segment color in one shot,
+            # and each boundary zone is then a single linspace blend. No
+            # per-row Python iteration or segment scan remains.
+            seg_lengths = [seg_end - seg_start for seg_start, seg_end, _ in segments]
+            # Rounding can leave a short tail; extend the last color over it
+            seg_lengths[-1] += h0 - segments[-1][1]
+            seg_of_row = np.repeat(np.arange(len(segments)), seg_lengths)
+            colors = np.array([c for _, _, c in segments], dtype=np.float32)
+            rows = colors[seg_of_row]
+
+            half = gradient_size // 2
+            for seg_idx in range(1, len(segments)):
+                if segments[seg_idx - 1][2] == segments[seg_idx][2]:
+                    # Identical neighbors (possible via the fallback
+                    # palette): blending is a no-op, skip it
+                    continue
+                prev_start, prev_end, _ = segments[seg_idx - 1]
+                seg_start, seg_end, _ = segments[seg_idx]
+                boundary = seg_start
+                # Clamp each zone to its neighbors' midpoints so blends
+                # around short segments shrink rather than overlap
+                zone_start = max(0, boundary - half, (prev_start + prev_end) // 2)
+                zone_end = min(h0, boundary + half, (seg_start + seg_end) // 2)
+                if zone_end <= zone_start:
+                    continue
+                factors = np.linspace(
+                    0.0, 1.0, zone_end - zone_start, dtype=np.float32
+                )
+                rows[zone_start:zone_end] = _blend_array(
+                    colors[seg_idx - 1], colors[seg_idx], factors
+                )
+
+            if h0 != h:
+                # Linear row interpolation up to full resolution; equivalent
+                # to a BILINEAR resize since color only varies vertically
+                pos = np.linspace(0.0, h0 - 1.0, h, dtype=np.float32)
+                lo = np.floor(pos).astype(np.intp)
+                hi = np.minimum(lo + 1, h0 - 1)
+                frac = (pos - lo)[:, None]
+                rows = rows[lo] * (1.0 - frac) + rows[hi] * frac
+
+            # Assemble the full RGBA surface in one pass: row colors
+            # broadcast across the width, alpha taken straight from the pill
+            # mask, so no separate putalpha traversal is needed
+            arr = np.empty((h, w, 4), dtype=np.uint8)
+            arr[:, :, :3] = rows[:, :3].astype(np.uint8)[:, None, :]
+            arr[:, :, 3] = np.asarray(mask, dtype=np.uint8)
+            return Image.fromarray(arr, "RGBA")
         else:
-            # Draw solid color blocks without gradient blending
+            # Fill solid color blocks without gradient blending; paste with a
+            # color and box hits Pillow's C fill directly, with no ImageDraw
+            # dispatch. The fill has to cover the pill on its own now, so the
+            # last segment absorbs any rounding tail.
+            bar_img = Image.new("RGBA", (w0, h0), (0, 0, 0, 0))
+            last_start, _, last_color = segments[-1]
+            segments[-1] = (last_start, h0, last_color)
             for seg_start, seg_end, seg_color in segments:
-                bar_draw.rectangle([0, seg_start, w, seg_end], fill=seg_color)
+                bar_img.paste(seg_color, (0, seg_start, w0, seg_end))
 
-        # Clip the stacked fill to a rounded mask for pill-like ends
-        mask = Image.new("L", (w, h), 0)
-        mask_draw = ImageDraw.Draw(mask)
-        mask_draw.rounded_rectangle(
-            [0, 0, w, h],
-            radius=max(1, w // 2),
-            fill=255,
-        )
+        if (w0, h0) != (w, h):
+            bar_img = bar_img.resize((w, h), Image.Resampling.BILINEAR)
+
+        # Clip the stacked fill to the rounded mask for pill-like ends
         bar_img.putalpha(mask)
-        image.paste(bar_img, (x, y), bar_img)
-        
-        # Draw border around the bar if enabled
-        if show_border:
-            border_width = max(1, self._s(1))
-            draw.rounded_rectangle(
-                [x, y, x + w, y + h],
-                radius=max(1, w // 2),
-                outline=self.language_bar_border_color,
-                width=border_width,
+        return bar_img
+
+    def _bar_mask(self, w: int, h: int) -> Image.Image:
+        """Rounded pill mask for the language bar, cached per geometry."""
+        mask_key = (w, h, max(1, w // 2))
+        mask = self._bar_mask_cache.get(mask_key)
+        if mask is None:
+            mask = Image.new("L", (w, h), 0)
+            mask_draw = ImageDraw.Draw(mask)
+            mask_draw.rounded_rectangle(
+                [0, 0, w, h],
+                radius=mask_key[2],
+                fill=255,
             )
-    
-    def _blend_colors(
+            self._bar_mask_cache[mask_key] = mask
+        return mask
+
+    def _text_width(
         self,
-        color1: tuple[int, int, int, int],
-        color2: tuple[int, int, int, int],
-        factor: float,
-    ) -> tuple[int, int, int, int]:
-        """Blend two RGBA colors. factor=0 returns color1, factor=1 returns color2."""
-        factor = max(0.0, min(1.0, factor))
-        return (
-            int(color1[0] + (color2[0] - color1[0]) * factor),
-            int(color1[1] + (color2[1] - color1[1]) * factor),
-            int(color1[2] + (color2[2] - color1[2]) * factor),
-            int(color1[3] + (color2[3] - color1[3]) * factor),
-        )
+        text: str,
+        font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+    ) -> int:
+        """Measure text advance width, cached on (text, font) identity."""
+        key = (text, id(font))
+        width = self._text_width_cache.get(key)
+        if width is None:
+            width = int(font.getlength(text))
+            self._text_width_cache[key] = width
+        return width
 
     def _draw_vertical_language_legend(
         self,
@@ -1128,39 +1505,48 @@ class StatsCardRenderer:
         languages: list[tuple[str, float]],
     ) -> None:
         """Draw language legend to the right of the bar."""
-        row_height = self._s(36)
+        # Scaled constants hoisted out of the row loop, via a local binding
+        s = self._s
+        row_height = s(36)
         visible_languages = languages[:5]
-        dot_size = self._s(10)
-        text_x = x + self._s(20)
-        
+        dot_size = s(10)
+        text_x = x + s(20)
+        dot_offset = s(5)
+        pct_gap = s(8)
+
+        # Lay out all rows first, then draw in three homogeneous passes
+        # (dots, names, percentages) so each pass keeps one primitive and
+        # one font instead of interleaving per row
+        rows: list[tuple[int, tuple[int, int, int, int], str, int, str]] = []
         for i, (lang, percentage) in enumerate(visible_languages):
-            # Use GitHub's official language color
-            color = hex_to_rgba(get_language_color(lang, i))
-            
             # Fixed row position (same approach as stats section)
             item_y = y + i * row_height
-            
-            # Draw dot aligned with text (offset to match text baseline visually)
-            dot_y = item_y + self._s(5)
+            pct_x = text_x + self._text_width(lang, self.body_font) + pct_gap
+            rows.append(
+                (item_y, _language_rgba(lang, i), lang, pct_x, f"{percentage}%")
+            )
+
+        # Dots aligned with text (offset to match text baseline visually)
+        for item_y, color, _, _, _ in rows:
+            dot_y = item_y + dot_offset
             draw.ellipse(
                 [x, dot_y, x + dot_size, dot_y + dot_size],
                 fill=color,
             )
-            
-            # Draw language name at row position
+
+        # Language names at row positions
+        for item_y, _, lang, _, _ in rows:
             draw.text(
                 (text_x, item_y),
                 lang,
                 font=self.body_font,
                 fill=self.text_color
             )
-            
-            # Draw percentage to the right of language name
-            lang_bbox = draw.textbbox((0, 0), lang, font=self.body_font)
-            lang_width = lang_bbox[2] - lang_bbox[0]
-            pct_text = f"{percentage}%"
+
+        # Percentages to the right of the language names
+        for item_y, _, _, pct_x, pct_text in rows:
             draw.text(
-                (text_x + lang_width + self._s(8), item_y),
+                (pct_x, item_y),
                 pct_text,
                 font=self.small_font,
                 fill=self.secondary_color
@@ -1168,7 +1554,10 @@ class StatsCardRenderer:
 
     def _normalize_language_name(self, name: str) -> str:
         """Normalize a language name for case-insensitive matching."""
-        return (name or "").strip().casefold()
+        name = (name or "").strip()
+        if name.isascii():
+            return name.translate(_ASCII_LOWER_TABLE)
+        return name.casefold()
 
     def _filter_languages(
         self, languages: list[tuple[str, float]], excluded: list[str]
@@ -1198,23 +1587,9 @@ class StatsCardRenderer:
 
     def _draw_etch_lines(self, draw: ImageDraw.ImageDraw) -> None:
         """Draw decorative diagonal etch lines in the bottom-right corner."""
-        # Etch line color: light gray with 70% opacity
-        etch_color = hex_to_rgba("#E5E5E5", int(255 * 0.7))
-        line_width = max(1, self._s(1))
-
-        # Three diagonal lines from mockup coordinates (base 800x400 card)
-        # Line 1 (shortest, closest to corner): (791.375, 369.331) to (776.375, 386.331)
-        # Line 2 (medium): (791.367, 359.34) to (766.367, 386.34)
-        # Line 3 (longest): (791.354, 349.354) to (754.354, 386.354)
-        etch_lines = [
-            ((791.375, 369.331), (776.375, 386.331)),
-            ((791.367, 359.34), (766.367, 386.34)),
-            ((791.354, 349.354), (754.354, 386.354)),
-        ]
-
-        for (x1, y1), (x2, y2) in etch_lines:
+        for start, end in self._etch_lines_scaled:
             draw.line(
-                [(self._s(x1), self._s(y1)), (self._s(x2), self._s(y2))],
-                fill=etch_color,
-                width=line_width,
+                [start, end],
+                fill=self._etch_color,
+                width=self._etch_line_width,
             )